@@ -15,7 +15,7 @@ import os
 from dataclasses import fields
 from pathlib import Path
 from textwrap import dedent
-from pkg_resources import get_distribution
+from importlib.metadata import version as pkg_version
 
 sys.path.insert(0, os.path.abspath('..'))
 
@@ -54,7 +54,7 @@ copyright = '2015 - 2022, Adrien Morison, Martina Ulvrova, Stéphane Labrosse'
 author = 'Adrien Morison, Martina Ulvrova, Stéphane Labrosse'
 
 # The full version, including alpha/beta/rc tags.
-release = get_distribution("stagpy").version
+release = pkg_version("stagpy")
 # The short X.Y version.
 version = '.'.join(release.split('.')[:2])
 
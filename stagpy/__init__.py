@@ -18,19 +18,23 @@ and uppercase versions of those.
 
 from __future__ import annotations
 
+import contextlib
+import importlib.metadata as imlm
 import importlib.resources as imlr
 import os
+import pathlib
+import pickle
 import shutil
 import signal
 import sys
+import tempfile
 import typing
-
-from setuptools_scm import get_version
+from dataclasses import fields
 
 from . import _styles, config
 
 if typing.TYPE_CHECKING:
-    from typing import Any, Iterator, NoReturn
+    from typing import Any, Dict, Iterator, List, NoReturn, Optional
 
 
 def _env(var: str) -> bool:
@@ -59,22 +63,134 @@ def _iter_styles() -> Iterator[str]:
             yield resource
 
 
+def _write_atomically(path: pathlib.Path, content: bytes) -> None:
+    """Write a file through a uniquely named temporary file.
+
+    Concurrent writers never see a partially written file nor each other's
+    temporary file.
+    """
+    tmp = tempfile.NamedTemporaryFile(
+        dir=path.parent, prefix=f"{path.name}.", suffix=".tmp", delete=False
+    )
+    # temporary files are private, use the permissions of a regular file
+    umask = os.umask(0)
+    os.umask(umask)
+    try:
+        with tmp:
+            tmp.write(content)
+        os.chmod(tmp.name, 0o666 & ~umask)
+        os.replace(tmp.name, path)
+    except OSError:
+        with contextlib.suppress(OSError):
+            os.unlink(tmp.name)
+        raise
+
+
+def _recorded_version() -> Optional[str]:
+    """Return the version recorded in the config directory, if any."""
+    try:
+        return (config.CONFIG_DIR / ".version").read_text()
+    except OSError:
+        return None
+
+
+def _resolve_version() -> str:
+    """Compute StagPy version.
+
+    Git is only queried via setuptools_scm when running from a git checkout,
+    the version module generated at install time is used otherwise.
+    """
+    if (pathlib.Path(__file__).resolve().parent.parent / ".git").exists():
+        from setuptools_scm import get_version
+
+        try:
+            return get_version(root="..", relative_to=__file__)
+        except LookupError:
+            pass
+    try:
+        from ._version import version
+    except ImportError:
+        try:
+            return imlm.version("stagpy")
+        except imlm.PackageNotFoundError:
+            return "unknown"
+    return version
+
+
 def _check_config() -> None:
     """Create config files as necessary."""
-    config.CONFIG_DIR.mkdir(parents=True, exist_ok=True)
-    verfile = config.CONFIG_DIR / ".version"
-    uptodate = verfile.is_file() and verfile.read_text() == __version__
+    try:
+        with os.scandir(config.CONFIG_DIR) as entries:
+            present = {entry.name for entry in entries}
+    except FileNotFoundError:
+        config.CONFIG_DIR.mkdir(parents=True, exist_ok=True)
+        present = set()
+    uptodate = _RECORDED_VERSION == __version__
+    styles = list(_iter_styles())
+    if uptodate and present.issuperset((config.CONFIG_FILE.name, *styles)):
+        return
     if not uptodate:
-        verfile.write_text(__version__)
-    if not (uptodate and config.CONFIG_FILE.is_file()):
+        _write_atomically(config.CONFIG_DIR / ".version", __version__.encode())
+    if not (uptodate and config.CONFIG_FILE.name in present):
         conf.to_file_(config.CONFIG_FILE)
-    for stfile in _iter_styles():
-        stfile_conf = config.CONFIG_DIR / stfile
-        if not (uptodate and stfile_conf.is_file()):
+    for stfile in styles:
+        if not (uptodate and stfile in present):
+            stfile_conf = config.CONFIG_DIR / stfile
             with imlr.path(_styles, stfile) as stfile_local:
                 shutil.copy(str(stfile_local), str(stfile_conf))
 
 
+def _read_config_files() -> None:
+    """Update conf from the config files.
+
+    Parsed values are cached in the config directory along with the version,
+    size, and modification time of the files. They are parsed again only if
+    one of those changed.
+    """
+    cache_file = config.CONFIG_DIR / ".conf.cache.pkl"
+    key: List[object] = [__version__]
+    for path in (config.CONFIG_FILE, config.CONFIG_LOCAL):
+        try:
+            stat = path.stat()
+        except OSError:
+            key.append(None)
+        else:
+            key.append((os.path.abspath(path), stat.st_mtime_ns, stat.st_size))
+
+    updates = None
+    try:
+        with cache_file.open("rb") as pkl:
+            cached_key, cached_values = pickle.load(pkl)
+        if cached_key == key:
+            updates = [
+                (getattr(conf, sec_name), opt, val)
+                for sec_name, opts in cached_values.items()
+                for opt, val in opts.items()
+            ]
+    except Exception:
+        # missing, corrupt, or unexpected cache, parse the files instead
+        updates = None
+    if updates is not None:
+        for section, opt, val in updates:
+            setattr(section, opt, val)
+        return
+
+    conf.update_from_file_(config.CONFIG_FILE)
+    if key[2] is not None:
+        conf.update_from_file_(config.CONFIG_LOCAL)
+    values: Dict[str, Dict[str, Any]] = {}
+    for sec in fields(conf):
+        section = getattr(conf, sec.name)
+        values[sec.name] = {
+            fld.name: getattr(section, fld.name)
+            for fld in fields(section)
+            if section.meta_(fld.name).entry.in_file
+        }
+    # a cache that cannot be written is simply not used
+    with contextlib.suppress(OSError, pickle.PicklingError, TypeError, AttributeError):
+        _write_atomically(cache_file, pickle.dumps((key, values)))
+
+
 if DEBUG:
     print(
         "StagPy runs in DEBUG mode because the environment variable",
@@ -82,23 +198,18 @@ if DEBUG:
         sep="\n",
         end="\n\n",
     )
-else:
+# interruptions are only handled gracefully in interactive sessions
+_HANDLE_INT = not DEBUG and sys.stdin is not None and sys.stdin.isatty()
+if _HANDLE_INT:
     _PREV_INT = signal.signal(signal.SIGINT, sigint_handler)
 
-try:
-    __version__ = get_version(root="..", relative_to=__file__)
-except LookupError:
-    try:
-        from ._version import version as __version__
-    except ImportError:
-        __version__ = "unknown"
+_RECORDED_VERSION = None if ISOLATED else _recorded_version()
+__version__ = _resolve_version()
 
 conf = config.Config.default_()
 if not ISOLATED:
     _check_config()
-    conf.update_from_file_(config.CONFIG_FILE)
-    if config.CONFIG_LOCAL.is_file():
-        conf.update_from_file_(config.CONFIG_LOCAL)
+    _read_config_files()
 
-if not DEBUG:
+if _HANDLE_INT:
     signal.signal(signal.SIGINT, _PREV_INT)
@@ -3,10 +3,9 @@
 from __future__ import annotations
 
 import typing
+from functools import lru_cache
 from inspect import getdoc
 
-import matplotlib.pyplot as plt
-
 from . import conf
 
 if typing.TYPE_CHECKING:
@@ -67,6 +66,8 @@ def saveplot(
         name_args: positional arguments passed on to :func:`out_name`.
         name_kwargs: keyword arguments passed on to :func:`out_name`.
     """
+    import matplotlib.pyplot as plt
+
     oname = out_name(*name_args, **name_kwargs)
     fig.savefig(
         f"{oname}.{conf.plot.format}", format=conf.plot.format, bbox_inches="tight"
@@ -75,6 +76,7 @@ def saveplot(
         plt.close(fig)
 
 
+@lru_cache(maxsize=None)
 def baredoc(obj: object) -> str:
     """Return the first line of the docstring of an object.
 
@@ -2,28 +2,18 @@
 
 from __future__ import annotations
 
+import importlib
 import importlib.resources as imlr
 import typing
+from dataclasses import dataclass
 from inspect import isfunction
 from types import MappingProxyType
 
-import matplotlib.pyplot as plt
-import matplotlib.style as mpls
 from loam.cli import CLIManager, Subcmd
 
 from . import ISOLATED
 from . import __doc__ as doc_module
-from . import (
-    _styles,
-    commands,
-    conf,
-    config,
-    field,
-    plates,
-    refstate,
-    rprof,
-    time_series,
-)
+from . import _styles, commands, conf, config
 from ._helpers import baredoc
 from .config import CONFIG_DIR
 
@@ -31,12 +21,35 @@ if typing.TYPE_CHECKING:
     from typing import Any, Callable, List, Optional
 
 
+@dataclass(frozen=True)
+class _LazyCmd:
+    """Subcommand implemented by the cmd function of a module.
+
+    The module is only imported when the subcommand is run, this avoids
+    loading plotting libraries for other subcommands.
+    """
+
+    module: str
+
+    def load(self) -> Callable[[], None]:
+        """Import the module and return its cmd function."""
+        return importlib.import_module(f".{self.module}", __package__).cmd
+
+
 def _sub(cmd: Any, *sections: str) -> Subcmd:
     """Build Subcmd instance."""
     cmd_func = cmd if isfunction(cmd) else cmd.cmd
     return Subcmd(baredoc(cmd), *sections, func=cmd_func)
 
 
+def _lazy_sub(module: str, help_msg: str, *sections: str) -> Subcmd:
+    """Build Subcmd instance whose module is imported when it is run.
+
+    The help message should be the first line of the module docstring.
+    """
+    return Subcmd(help_msg, *sections, func=_LazyCmd(module))
+
+
 def _bare_cmd() -> None:
     """Print help message when no arguments are given."""
     print(doc_module)
@@ -45,6 +58,11 @@ def _bare_cmd() -> None:
 
 def _load_mplstyle() -> None:
     """Try to load conf.plot.mplstyle matplotlib style."""
+    if not (conf.plot.mplstyle or conf.plot.xkcd):
+        return
+    import matplotlib.pyplot as plt
+    import matplotlib.style as mpls
+
     for style in conf.plot.mplstyle:
         style_fname = style + ".mplstyle"
         if not ISOLATED:
@@ -65,11 +83,17 @@ def _load_mplstyle() -> None:
 SUB_CMDS = MappingProxyType(
     {
         "common_": Subcmd(doc_module, "common", func=_bare_cmd),
-        "field": _sub(field, "core", "plot", "scaling"),
-        "rprof": _sub(rprof, "core", "plot", "scaling"),
-        "time": _sub(time_series, "core", "plot", "scaling"),
-        "refstate": _sub(refstate, "core", "plot"),
-        "plates": _sub(plates, "core", "plot", "scaling"),
+        "field": _lazy_sub(
+            "field", "Plot scalar and vector fields", "core", "plot", "scaling"
+        ),
+        "rprof": _lazy_sub("rprof", "Plot radial profiles", "core", "plot", "scaling"),
+        "time": _lazy_sub(
+            "time_series", "Plots time series", "core", "plot", "scaling"
+        ),
+        "refstate": _lazy_sub(
+            "refstate", "Plot reference state profiles", "core", "plot"
+        ),
+        "plates": _lazy_sub("plates", "Plate analysis", "core", "plot", "scaling"),
         "info": _sub(commands.info_cmd, "core", "scaling"),
         "var": _sub(commands.var_cmd),
         "version": _sub(commands.version_cmd),
@@ -108,6 +132,9 @@ def parse_args(arglist: Optional[List[str]] = None) -> Callable[[], None]:
     if conf.common.config:
         commands.config_pp(climan.sections_list(sub_cmd))
 
-    _load_mplstyle()
+    if "plot" in climan.sections_list(sub_cmd):
+        _load_mplstyle()
 
+    if isinstance(cmd_args.func, _LazyCmd):
+        return cmd_args.func.load()
     return cmd_args.func
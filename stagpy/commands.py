@@ -2,22 +2,33 @@
 
 from __future__ import annotations
 
+import sys
 import typing
 from dataclasses import fields
-from itertools import zip_longest
+from functools import lru_cache
+from itertools import chain
 from math import ceil
 from shutil import get_terminal_size
 from textwrap import TextWrapper, indent
+from types import MappingProxyType
 
 import loam.tools
-import pandas
 
-from . import __version__, conf, phyvars, stagyydata
+from . import __version__, conf, phyvars
 from ._helpers import baredoc
-from .config import CONFIG_FILE
+from .config import CONFIG_FILE, Var
 
 if typing.TYPE_CHECKING:
-    from typing import Callable, Iterable, Mapping, Optional, Sequence, Tuple, Union
+    from typing import (
+        Callable,
+        Dict,
+        Iterable,
+        Mapping,
+        Optional,
+        Sequence,
+        Tuple,
+        Union,
+    )
 
     from loam.base import Section
 
@@ -30,10 +41,13 @@ def info_cmd() -> None:
     Other Parameters:
         conf.info
     """
+    import pandas
+
+    from . import stagyydata
+
     sdat = stagyydata.StagyyData()
     lsnap = sdat.snaps[-1]
     lstep = sdat.steps[-1]
-    print(f"StagYY run in {sdat.path}")
     if lsnap.geom.threed:
         dimension = "{0.nxtot} x {0.nytot} x {0.nztot}".format(lsnap.geom)
     elif lsnap.geom.twod_xz:
@@ -41,39 +55,34 @@ def info_cmd() -> None:
     else:
         dimension = "{0.nytot} x {0.nztot}".format(lsnap.geom)
     if lsnap.geom.cartesian:
-        print("Cartesian", dimension)
+        geometry = "Cartesian"
     elif lsnap.geom.cylindrical:
-        print("Cylindrical", dimension)
+        geometry = "Cylindrical"
     else:
-        print("Spherical", dimension)
-    print()
+        geometry = "Spherical"
+    sys.stdout.write(f"StagYY run in {sdat.path}\n{geometry} {dimension}\n\n")
     for step in sdat.walk:
-        print(f"Step {step.istep}/{lstep.istep}", end="")
+        step_header = f"Step {step.istep}/{lstep.istep}"
         if step.isnap is not None:
-            print(f", snapshot {step.isnap}/{lsnap.isnap}")
-        else:
-            print()
+            step_header += f", snapshot {step.isnap}/{lsnap.isnap}"
         series = step.timeinfo.loc[list(conf.info.output)]
         if conf.scaling.dimensional:
-            series = series.copy()
+            values = []
             dimensions = []
-            for var, val in series.iteritems():
+            for var, val in zip(series.index, series.to_numpy()):
                 meta = phyvars.TIME.get(var)
                 dim = meta.dim if meta is not None else "1"
                 if dim == "1":
                     dimensions.append("")
                 else:
-                    series[var], dim = sdat.scale(val, dim)
+                    val, dim = sdat.scale(val, dim)
                     dimensions.append(dim)
-            series = pandas.concat(
-                [
-                    series,
-                    pandas.Series(data=dimensions, index=series.index, name="dim"),
-                ],
-                axis=1,
+                values.append(val)
+            series = pandas.DataFrame(
+                {0: values, "dim": dimensions}, index=series.index
             )
-        print(indent(series.to_string(header=False), "  "))
-        print()
+        table = indent(series.to_string(header=False), "  ")
+        sys.stdout.write(f"{step_header}\n{table}\n\n")
 
 
 def _pretty_print(
@@ -91,6 +100,22 @@ def _pretty_print(
         text_width: text width to use. If set to None, will try to infer the
             size of the terminal.
     """
+    sys.stdout.write(_pretty_format(key_val, sep, min_col_width, text_width))
+
+
+def _pretty_format(
+    key_val: Sequence[Tuple[str, str]],
+    sep: str = ": ",
+    min_col_width: int = 39,
+    text_width: Optional[int] = None,
+) -> str:
+    """Format a iterable of key/values in columns.
+
+    See :func:`_pretty_print` for the meaning of arguments.
+
+    Returns:
+        the formatted text, including the final newline.
+    """
     if text_width is None:
         text_width = get_terminal_size().columns
     if text_width < min_col_width:
@@ -99,14 +124,22 @@ def _pretty_print(
     colw = (text_width + 1) // ncols - 1
     ncols = min(ncols, len(key_val))
 
-    wrapper = TextWrapper(width=colw)
+    wrappers: Dict[int, TextWrapper] = {}
     lines = []
     for key, val in key_val:
-        if len(key) + len(sep) >= colw // 2:
-            wrapper.subsequent_indent = " "
-        else:
-            wrapper.subsequent_indent = " " * (len(key) + len(sep))
-        lines.extend(wrapper.wrap(f"{key}{sep}{val}"))
+        text = f"{key}{sep}{val}"
+        # no wrapping nor whitespace cleanup needed, skip TextWrapper
+        if 0 < len(text) <= colw and text.isprintable() and text[-1] != " ":
+            lines.append(text)
+            continue
+        indent_width = len(key) + len(sep)
+        if indent_width >= colw // 2:
+            indent_width = 1
+        wrapper = wrappers.get(indent_width)
+        if wrapper is None:
+            wrapper = TextWrapper(width=colw, subsequent_indent=" " * indent_width)
+            wrappers[indent_width] = wrapper
+        lines.extend(wrapper.wrap(text))
 
     chunks = []
     for rem_col in range(ncols, 1, -1):
@@ -116,21 +149,58 @@ def _pretty_print(
         chunks.append(lines[:isep])
         lines = lines[isep:]
     chunks.append(lines)
-    full_lines = zip_longest(*chunks, fillvalue="")
 
-    fmt = "|".join([f"{{:{colw}}}"] * (ncols - 1))
-    fmt += "|{}" if ncols > 1 else "{}"
-    print(*(fmt.format(*line) for line in full_lines), sep="\n")
+    *left_chunks, last_chunk = chunks
+    blank = " " * colw
+    full_lines = []
+    for iline in range(max(map(len, chunks))):
+        row = [
+            chunk[iline].ljust(colw) if iline < len(chunk) else blank
+            for chunk in left_chunks
+        ]
+        row.append(last_chunk[iline] if iline < len(last_chunk) else "")
+        full_lines.append("|".join(row))
+    return "\n".join(full_lines) + "\n"
+
+
+_NO_EXTRA: Mapping[str, Callable] = MappingProxyType({})
+_LAYOUT_CACHE_SIZE = 16
+# the mappings are kept alive alongside the text so that their ids cannot be
+# reused by other objects while they are in the cache
+_LAYOUT_CACHE: Dict[Tuple[int, int, int], Tuple[Mapping, Mapping, str]] = {}
 
 
 def _layout(
     dict_vars: Mapping[str, Union[Varf, Varr, Vart]],
     dict_vars_extra: Mapping[str, Callable],
+    text_width: Optional[int] = None,
 ) -> None:
-    """Print nicely [(var, description)] from phyvars."""
-    desc = [(v, m.description) for v, m in dict_vars.items()]
-    desc.extend((v, baredoc(m)) for v, m in dict_vars_extra.items())
-    _pretty_print(desc, min_col_width=26)
+    """Print nicely [(var, description)] from phyvars.
+
+    The output is memoized for a given pair of mappings and text width, the
+    mappings should therefore not be mutated.
+    """
+    if text_width is None:
+        text_width = get_terminal_size().columns
+    key = (id(dict_vars), id(dict_vars_extra), text_width)
+    if key not in _LAYOUT_CACHE:
+        desc = list(
+            chain(
+                ((v, m.description) for v, m in dict_vars.items()),
+                ((v, baredoc(m)) for v, m in dict_vars_extra.items()),
+            )
+        )
+        text = _pretty_format(desc, min_col_width=26, text_width=text_width)
+        if len(_LAYOUT_CACHE) >= _LAYOUT_CACHE_SIZE:
+            del _LAYOUT_CACHE[next(iter(_LAYOUT_CACHE))]
+        _LAYOUT_CACHE[key] = (dict_vars, dict_vars_extra, text)
+    sys.stdout.write(_LAYOUT_CACHE[key][2])
+
+
+@lru_cache(maxsize=None)
+def _var_field_names() -> Tuple[str, ...]:
+    """Names of the options of the var section."""
+    return tuple(fld.name for fld in fields(Var))
 
 
 def var_cmd() -> None:
@@ -139,26 +209,27 @@ def var_cmd() -> None:
     See :mod:`stagpy.phyvars` where the lists of variables organized by command
     are defined.
     """
-    print_all = not any(getattr(conf.var, fld.name) for fld in fields(conf.var))
+    print_all = not any(getattr(conf.var, name) for name in _var_field_names())
+    text_width = get_terminal_size().columns
     if print_all or conf.var.field:
         print("field:")
-        _layout(phyvars.FIELD, phyvars.FIELD_EXTRA)
+        _layout(phyvars.FIELD, phyvars.FIELD_EXTRA, text_width)
         print()
     if print_all or conf.var.sfield:
         print("surface field:")
-        _layout(phyvars.SFIELD, {})
+        _layout(phyvars.SFIELD, _NO_EXTRA, text_width)
         print()
     if print_all or conf.var.rprof:
         print("rprof:")
-        _layout(phyvars.RPROF, phyvars.RPROF_EXTRA)
+        _layout(phyvars.RPROF, phyvars.RPROF_EXTRA, text_width)
         print()
     if print_all or conf.var.time:
         print("time:")
-        _layout(phyvars.TIME, phyvars.TIME_EXTRA)
+        _layout(phyvars.TIME, phyvars.TIME_EXTRA, text_width)
         print()
     if print_all or conf.var.refstate:
         print("refstate:")
-        _layout(phyvars.REFSTATE, {})
+        _layout(phyvars.REFSTATE, _NO_EXTRA, text_width)
         print()
 
 
@@ -177,20 +248,19 @@ def config_pp(subs: Iterable[str]) -> None:
         subs: conf sections to print.
     """
     print("(c|f): available only as CLI argument/in the config file", end="\n\n")
+    text_width = min(get_terminal_size().columns, 100)
     for sub in subs:
         section: Section = getattr(conf, sub)
-        hlp_lst = []
-        for fld in fields(section):
-            opt = fld.name
-            entry = section.meta_(opt).entry
-            if entry.in_cli ^ entry.in_file:
-                opt += " (c)" if entry.in_cli else " (f)"
-            hlp_lst.append((opt, entry.doc))
+        entries = [(fld.name, section.meta_(fld.name).entry) for fld in fields(section)]
+        hlp_lst = [
+            (f"{opt} ({'c' if entry.in_cli else 'f'})", entry.doc)
+            if entry.in_cli ^ entry.in_file
+            else (opt, entry.doc)
+            for opt, entry in entries
+        ]
         if hlp_lst:
             print(f"{sub}:")
-            _pretty_print(
-                hlp_lst, sep=" -- ", text_width=min(get_terminal_size().columns, 100)
-            )
+            _pretty_print(hlp_lst, sep=" -- ", text_width=text_width)
             print()
 
 
@@ -1,9 +1,17 @@
 import re
+import subprocess
+import sys
+from importlib import import_module
 
 import pytest
 from pytest import CaptureFixture
 
 import stagpy.args
+import stagpy.field
+import stagpy.plates
+import stagpy.rprof
+import stagpy.time_series
+from stagpy._helpers import baredoc
 
 
 def test_no_args(capsys: CaptureFixture) -> None:
@@ -84,3 +92,21 @@ def test_version_subcmd() -> None:
 def test_config_subcmd() -> None:
     func = stagpy.args.parse_args(["config"])
     assert func is stagpy.commands.config_cmd
+
+
+def test_lazy_subcmd_help() -> None:
+    for sub in stagpy.args.SUB_CMDS.values():
+        func = sub.defaults["func"]
+        if isinstance(func, stagpy.args._LazyCmd):
+            assert sub.help == baredoc(import_module(f"stagpy.{func.module}"))
+
+
+def test_version_subcmd_no_matplotlib() -> None:
+    script = (
+        "import sys; import stagpy.args; stagpy.args.parse_args(['version']); "
+        "print('matplotlib' in sys.modules)"
+    )
+    subp = subprocess.run(
+        [sys.executable, "-c", script], stdout=subprocess.PIPE, check=True
+    )
+    assert subp.stdout.strip() == b"False"
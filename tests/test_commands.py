@@ -1,4 +1,6 @@
 import re
+import subprocess
+import sys
 from pathlib import Path
 
 from pytest import CaptureFixture
@@ -17,6 +19,20 @@ def test_info_cmd(capsys: CaptureFixture, example_dir: Path) -> None:
     del stagpy.conf.core.path
 
 
+def test_info_cmd_dimensional(capsys: CaptureFixture, example_dir: Path) -> None:
+    stagpy.conf.core.path = example_dir
+    stagpy.conf.scaling.dimensional = True
+    stagpy.commands.info_cmd()
+    output = capsys.readouterr()
+    expected = re.compile(
+        r"^StagYY run in.*\n.* x .*\n\nStep.*, snapshot.*\n  t .*yr\n.*\n\n$",
+        flags=re.DOTALL,
+    )
+    assert expected.fullmatch(output.out)
+    del stagpy.conf.core.path
+    del stagpy.conf.scaling.dimensional
+
+
 def test_var_cmd(capsys: CaptureFixture) -> None:
     stagpy.commands.var_cmd()
     output = capsys.readouterr()
@@ -24,6 +40,22 @@ def test_var_cmd(capsys: CaptureFixture) -> None:
     assert expected.fullmatch(output.out)
 
 
+def test_var_cmd_option_reset(capsys: CaptureFixture) -> None:
+    stagpy.conf.var.time = True
+    del stagpy.conf.var.time
+    stagpy.commands.var_cmd()
+    output = capsys.readouterr()
+    assert output.out.startswith("field:\n")
+
+
+def test_var_cmd_repeated(capsys: CaptureFixture) -> None:
+    stagpy.commands.var_cmd()
+    first = capsys.readouterr()
+    stagpy.commands.var_cmd()
+    second = capsys.readouterr()
+    assert first.out == second.out
+
+
 def test_version_cmd(capsys: CaptureFixture) -> None:
     stagpy.commands.version_cmd()
     output = capsys.readouterr()
@@ -36,3 +68,15 @@ def test_config_cmd(capsys: CaptureFixture) -> None:
     output = capsys.readouterr()
     expected = "(c|f): available only as CLI argument/in the config file"
     assert output.out.startswith(expected)
+
+
+def test_non_info_cmds_no_pandas() -> None:
+    script = (
+        "import sys; import stagpy.args; "
+        "[stagpy.args.parse_args([cmd]) for cmd in ('var', 'version', 'config')]; "
+        "print('pandas' in sys.modules)"
+    )
+    subp = subprocess.run(
+        [sys.executable, "-c", script], stdout=subprocess.PIPE, check=True
+    )
+    assert subp.stdout.strip() == b"False"
@@ -0,0 +1,94 @@
+import os
+import pickle
+import stat
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Iterator
+
+from pytest import MonkeyPatch, fixture, mark
+
+import stagpy
+import stagpy.config
+
+
+@fixture
+def conf_dir(tmp_path: Path, monkeypatch: MonkeyPatch) -> Path:
+    monkeypatch.setattr(stagpy.config, "CONFIG_DIR", tmp_path)
+    monkeypatch.setattr(stagpy.config, "CONFIG_FILE", tmp_path / "config.toml")
+    monkeypatch.setattr(stagpy.config, "CONFIG_LOCAL", tmp_path / "local.toml")
+    monkeypatch.setattr(stagpy, "conf", stagpy.config.Config.default_())
+    return tmp_path
+
+
+def read_fresh_conf(monkeypatch: MonkeyPatch) -> stagpy.config.Config:
+    monkeypatch.setattr(stagpy, "conf", stagpy.config.Config.default_())
+    stagpy._read_config_files()
+    return stagpy.conf
+
+
+def test_read_config_files_edited(conf_dir: Path, monkeypatch: MonkeyPatch) -> None:
+    conf_file = conf_dir / "config.toml"
+    conf_file.write_text('[plot]\nformat = "png"\n')
+    os.utime(conf_file, ns=(1_000_000_000, 1_000_000_000))
+    assert read_fresh_conf(monkeypatch).plot.format == "png"
+    assert (conf_dir / ".conf.cache.pkl").is_file()
+    assert read_fresh_conf(monkeypatch).plot.format == "png"
+    conf_file.write_text('[plot]\nformat = "svg"\n')
+    os.utime(conf_file, ns=(2_000_000_000, 2_000_000_000))
+    assert read_fresh_conf(monkeypatch).plot.format == "svg"
+
+
+@mark.parametrize("content", [b"not a pickle", pickle.dumps(42), b""])
+def test_read_config_files_corrupt_cache(
+    conf_dir: Path, monkeypatch: MonkeyPatch, content: bytes
+) -> None:
+    (conf_dir / "config.toml").write_text('[plot]\nformat = "png"\n')
+    cache_file = conf_dir / ".conf.cache.pkl"
+    cache_file.write_bytes(content)
+    assert read_fresh_conf(monkeypatch).plot.format == "png"
+    cached_key, _ = pickle.loads(cache_file.read_bytes())
+    assert cached_key[0] == stagpy.__version__
+
+
+def test_read_config_files_unpicklable(conf_dir: Path) -> None:
+    (conf_dir / "config.toml").write_text('[plot]\nformat = "png"\n')
+    stagpy.conf.scaling.factors = {"s": lambda: "M"}  # type: ignore
+    stagpy._read_config_files()
+    assert stagpy.conf.plot.format == "png"
+    assert not (conf_dir / ".conf.cache.pkl").exists()
+
+
+def test_write_atomically_concurrent(tmp_path: Path) -> None:
+    target = tmp_path / ".version"
+    contents = [f"1.{i}".encode() for i in range(50)]
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        list(pool.map(lambda c: stagpy._write_atomically(target, c), contents))
+    assert target.read_bytes() in contents
+    assert list(tmp_path.iterdir()) == [target]
+
+
+def test_write_atomically_umask(tmp_path: Path) -> None:
+    target = tmp_path / ".version"
+    old_umask = os.umask(0o022)
+    try:
+        stagpy._write_atomically(target, b"1.0")
+    finally:
+        os.umask(old_umask)
+    assert stat.S_IMODE(target.stat().st_mode) == 0o644
+
+
+def test_check_config_dir_created_concurrently(
+    conf_dir: Path, monkeypatch: MonkeyPatch
+) -> None:
+    config_dir = conf_dir / "stagpy"
+    monkeypatch.setattr(stagpy.config, "CONFIG_DIR", config_dir)
+    monkeypatch.setattr(stagpy.config, "CONFIG_FILE", config_dir / "config.toml")
+
+    def scandir_race(path: Path) -> Iterator[os.DirEntry]:
+        # another process creates the directory right after the failed listing
+        config_dir.mkdir()
+        raise FileNotFoundError(path)
+
+    monkeypatch.setattr(stagpy.os, "scandir", scandir_race)
+    stagpy._check_config()
+    assert (config_dir / "config.toml").is_file()
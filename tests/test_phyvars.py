@@ -4,9 +4,9 @@ from stagpy import phyvars
 
 
 def test_dim() -> None:
+    scales = frozenset(phyvars.SCALES)
     allvars = chain(
         phyvars.FIELD.values(), phyvars.RPROF.values(), phyvars.TIME.values()
     )
-    for var in allvars:
-        if var.dim != "1":  # type: ignore
-            assert var.dim in phyvars.SCALES  # type: ignore
+    dims = {var.dim for var in allvars if var.dim != "1"}  # type: ignore
+    assert dims <= scales